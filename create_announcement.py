@@ -1,44 +1,67 @@
 """Generate a formatted Word document announcement for Sefaria Chat."""
+import copy
+import functools
+import io
+import os
+
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import qn
-import os
 
-doc = Document()
-
-# -- Page margins --
-for section in doc.sections:
-    section.top_margin = Inches(0.8)
-    section.bottom_margin = Inches(0.8)
-    section.left_margin = Inches(1.0)
-    section.right_margin = Inches(1.0)
-
-# -- Style tweaks --
-style = doc.styles['Normal']
-font = style.font
-font.name = 'Calibri'
-font.size = Pt(11)
-font.color.rgb = RGBColor(0x33, 0x33, 0x33)
-style.paragraph_format.space_after = Pt(6)
-
-# Heading styles
-for level, size, color in [
-    ('Heading 1', 22, RGBColor(0x1A, 0x47, 0x8A)),
-    ('Heading 2', 15, RGBColor(0x2C, 0x5F, 0xA1)),
-    ('Heading 3', 13, RGBColor(0x3A, 0x7C, 0xBD)),
-]:
-    h = doc.styles[level]
-    h.font.name = 'Calibri'
-    h.font.size = Pt(size)
-    h.font.color.rgb = color
-    h.font.bold = True
-    h.paragraph_format.space_before = Pt(14)
-    h.paragraph_format.space_after = Pt(6)
-
-
-def add_styled_paragraph(text, bold=False, italic=False, size=None, color=None, alignment=None, space_after=None):
+# Shared sizes and colors, built once instead of per run
+_PT9 = Pt(9)
+_PT10 = Pt(10)
+_PT11 = Pt(11)
+_PT12 = Pt(12)
+_PT14 = Pt(14)
+_BLUE = RGBColor(0x1A, 0x47, 0x8A)
+_GREY33 = RGBColor(0x33, 0x33, 0x33)
+_GREY44 = RGBColor(0x44, 0x44, 0x44)
+_GREY55 = RGBColor(0x55, 0x55, 0x55)
+_GREY99 = RGBColor(0x99, 0x99, 0x99)
+
+# Decorative horizontal rule under the title
+_RULE = '━' * 50
+
+# Resolved once so set_cell_shading skips the per-call prefix lookup
+_QN_SHD = qn('w:shd')
+_QN_FILL = qn('w:fill')
+_QN_VAL = qn('w:val')
+
+
+# (style name, font size, color, space before, space after, bold)
+_STYLE_SPEC = [
+    ('Normal', _PT11, _GREY33, None, 6, None),
+    ('Heading 1', Pt(22), _BLUE, 14, 6, True),
+    ('Heading 2', Pt(15), RGBColor(0x2C, 0x5F, 0xA1), 14, 6, True),
+    ('Heading 3', Pt(13), RGBColor(0x3A, 0x7C, 0xBD), 14, 6, True),
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _template():
+    """Parse python-docx's default template once per process."""
+    return Document()
+
+
+def _apply_styles(doc):
+    """Apply the Normal and heading tweaks in one pass over _STYLE_SPEC."""
+    styles = doc.styles
+    for name, size, color, space_before, space_after, bold in _STYLE_SPEC:
+        s = styles[name]
+        f = s.font
+        f.name = 'Calibri'
+        f.size = size
+        f.color.rgb = color
+        if bold is not None:
+            f.bold = bold
+        pf = s.paragraph_format
+        if space_before is not None:
+            pf.space_before = Pt(space_before)
+        pf.space_after = Pt(space_after)
+
+
+def add_styled_paragraph(doc, text, bold=False, italic=False, size=None, color=None, alignment=None, space_after=None):
     p = doc.add_paragraph()
     run = p.add_run(text)
     run.bold = bold
@@ -54,7 +77,7 @@ def add_styled_paragraph(text, bold=False, italic=False, size=None, color=None,
     return p
 
 
-def add_bullet(text, bold_prefix=None):
+def add_bullet(doc, text, bold_prefix=None):
     p = doc.add_paragraph(style='List Bullet')
     if bold_prefix:
         run = p.add_run(bold_prefix)
@@ -65,233 +88,267 @@ def add_bullet(text, bold_prefix=None):
     return p
 
 
+def _render_bold_bullets(doc, items, color=_BLUE):
+    """Render (name, description) pairs as bullets with a bold colored lead-in."""
+    add_para = doc.add_paragraph
+    for name, desc in items:
+        p = add_para(style='List Bullet')
+        run = p.add_run(name)
+        run.bold = True
+        run.font.color.rgb = color
+        p.add_run(desc)
+
+
+def set_cell(cell, text, bold=False, size=10):
+    """Write cell text through a single run with formatting applied once."""
+    cell.text = ''
+    p = cell.paragraphs[0]
+    run = p.add_run(text)
+    run.bold = bold
+    run.font.size = Pt(size)
+
+
 def set_cell_shading(cell, color_hex):
     """Set background shading on a table cell."""
     shading = cell._element.get_or_add_tcPr()
-    shading_elem = shading.makeelement(qn('w:shd'), {
-        qn('w:fill'): color_hex,
-        qn('w:val'): 'clear',
+    shading_elem = shading.makeelement(_QN_SHD, {
+        _QN_FILL: color_hex,
+        _QN_VAL: 'clear',
     })
     shading.append(shading_elem)
 
 
-# ============================================================
-# TITLE
-# ============================================================
-title = doc.add_heading('Sefaria Chat', level=1)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-for run in title.runs:
-    run.font.size = Pt(28)
-    run.font.color.rgb = RGBColor(0x1A, 0x47, 0x8A)
-
-subtitle = add_styled_paragraph(
-    'AI-Powered Jewish Text Exploration, Right on Your Desktop',
-    bold=True, size=14, color=RGBColor(0x55, 0x55, 0x55),
-    alignment=WD_ALIGN_PARAGRAPH.CENTER, space_after=4
-)
-
-# Decorative line
-p = doc.add_paragraph()
-p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-run = p.add_run('━' * 50)
-run.font.color.rgb = RGBColor(0x1A, 0x47, 0x8A)
-run.font.size = Pt(10)
-p.paragraph_format.space_after = Pt(12)
-
-# ============================================================
-# INTRO
-# ============================================================
-p = doc.add_paragraph()
-run = p.add_run('Ever wished you could have a conversation with the entire Sefaria library? ')
-run.italic = True
-run.font.size = Pt(12)
-run.font.color.rgb = RGBColor(0x44, 0x44, 0x44)
-run = p.add_run('Now you can.')
-run.bold = True
-run.italic = True
-run.font.size = Pt(12)
-run.font.color.rgb = RGBColor(0x1A, 0x47, 0x8A)
-
-doc.add_paragraph(
-    'Sefaria Chat is a free, open-source desktop app that connects the world\u2019s largest '
-    'digital collection of Jewish texts \u2014 Torah, Talmud, Midrash, Halakha, Kabbalah, '
-    'philosophy, and more \u2014 to the AI model of your choice. Ask a question in plain English, '
-    'and the AI automatically searches Sefaria\u2019s library, retrieves primary sources with '
-    'original Hebrew/Aramaic alongside English translations, and weaves them into rich, scholarly '
-    'responses \u2014 complete with clickable links back to Sefaria.org.'
-)
-
-# ============================================================
-# WHAT CAN YOU ASK?
-# ============================================================
-doc.add_heading('What Can You Ask?', level=2)
-
-prompts = [
-    ('\u201cWhat is today\u2019s Torah portion and Daf Yomi?\u201d',
-     ' \u2014 pulls the live Jewish calendar'),
-    ('\u201cShow me an ancient manuscript of Genesis 1:1\u201d',
-     ' \u2014 retrieves and displays actual manuscript images'),
-    ('\u201cCompare translations of Psalm 23\u201d',
-     ' \u2014 shows multiple English renderings side by side'),
-    ('\u201cWhat does Judaism teach about forgiveness and repentance?\u201d',
-     ' \u2014 searches across the entire library and synthesizes sources from Tanakh, Talmud, Rambam, and beyond'),
-    ('\u201cExplain the structure of the Talmud \u2014 Mishnah and Gemara\u201d',
-     ' \u2014 gives a comprehensive educational overview'),
-    ('\u201cTell me about Shabbat \u2014 its sources, themes, and subtopics\u201d',
-     ' \u2014 pulls Sefaria\u2019s curated topic pages'),
-    ('\u201cLook up the word \u2018chesed\u2019 in Jastrow\u2019s dictionary\u201d',
-     ' \u2014 searches classical Hebrew/Aramaic dictionaries'),
-    ('\u201cWhat does Rashi say about Noah\u2019s drunkenness?\u201d',
-     ' \u2014 pinpoints specific commentary'),
-]
-
-for prompt_text, description in prompts:
-    p = doc.add_paragraph(style='List Bullet')
-    run = p.add_run(prompt_text)
+def build():
+    """Build the announcement document and save it next to this script."""
+    # Alignment enums are only used while building
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.enum.table import WD_TABLE_ALIGNMENT
+
+    doc = copy.deepcopy(_template())
+    # Bind the hot methods once; saves an attribute lookup per call
+    add_para = doc.add_paragraph
+    add_heading = doc.add_heading
+
+    # -- Page margins --
+    for section in doc.sections:
+        section.top_margin = Inches(0.8)
+        section.bottom_margin = Inches(0.8)
+        section.left_margin = Inches(1.0)
+        section.right_margin = Inches(1.0)
+
+    # -- Style tweaks --
+    _apply_styles(doc)
+
+    # ============================================================
+    # TITLE
+    # ============================================================
+    title = add_heading('Sefaria Chat', level=1)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for run in title.runs:
+        run.font.size = Pt(28)
+        run.font.color.rgb = _BLUE
+
+    # Subtitle (inlined: every option is set here, so skip the kwarg checks)
+    subtitle = add_para()
+    run = subtitle.add_run('AI-Powered Jewish Text Exploration, Right on Your Desktop')
     run.bold = True
-    run.font.color.rgb = RGBColor(0x1A, 0x47, 0x8A)
-    p.add_run(description)
-
-doc.add_paragraph()
-p = doc.add_paragraph()
-run = p.add_run('Every text reference is a clickable hyperlink. ')
-run.bold = True
-p.add_run('Click any source and it opens right inside the app in a side-by-side embedded browser.')
-
-# ============================================================
-# USE ANY AI MODEL
-# ============================================================
-doc.add_heading('Use Any AI Model \u2014 Online or Offline', level=2)
-
-doc.add_paragraph(
-    'Sefaria Chat supports 9 LLM providers with dozens of models, so you pick what works for you:'
-)
-
-# Provider table
-table = doc.add_table(rows=10, cols=3)
-table.style = 'Light Grid Accent 1'
-table.alignment = WD_TABLE_ALIGNMENT.CENTER
-
-headers = ['', 'Provider', 'Highlights']
-for i, h in enumerate(headers):
-    cell = table.rows[0].cells[i]
-    cell.text = h
-    for paragraph in cell.paragraphs:
-        for run in paragraph.runs:
-            run.bold = True
-            run.font.size = Pt(10)
-
-providers = [
-    ('\u2601\ufe0f', 'Google Gemini', 'Gemini 2.5 Flash, Pro, and more \u2014 free tier available!'),
-    ('\u2601\ufe0f', 'OpenAI', 'GPT-4.1, GPT-4o, o4 Mini'),
-    ('\u2601\ufe0f', 'Anthropic', 'Claude Sonnet 4, Claude 3.5 Haiku'),
-    ('\u2601\ufe0f', 'xAI', 'Grok 3, Grok 3 Mini (fast & regular)'),
-    ('\u2601\ufe0f', 'Mistral AI', 'Mistral Small, Medium, Large'),
-    ('\u2601\ufe0f', 'DeepSeek', 'DeepSeek-V3, DeepSeek-R1'),
-    ('\u2601\ufe0f', 'Groq', 'Llama 3.3 70B, Mixtral, Gemma 2 \u2014 blazing fast inference'),
-    ('\u2601\ufe0f', 'OpenRouter', 'Multi-model gateway \u2014 access dozens of models through one key'),
-    ('\U0001f4bb', 'Ollama (Local)', 'Runs 100% offline. No API key. No internet. Auto-detects your models.'),
-]
-
-for row_idx, (icon, provider, highlights) in enumerate(providers, start=1):
-    table.rows[row_idx].cells[0].text = icon
-    table.rows[row_idx].cells[1].text = provider
-    table.rows[row_idx].cells[2].text = highlights
-    for cell_idx in range(3):
-        for paragraph in table.rows[row_idx].cells[cell_idx].paragraphs:
-            for run in paragraph.runs:
-                run.font.size = Pt(10)
-    # Bold provider name
-    for paragraph in table.rows[row_idx].cells[1].paragraphs:
-        for run in paragraph.runs:
-            run.bold = True
-
-# Set column widths
-for row in table.rows:
-    row.cells[0].width = Inches(0.4)
-    row.cells[1].width = Inches(1.6)
-    row.cells[2].width = Inches(4.5)
-
-doc.add_paragraph()
-
-# Callout paragraphs
-p = doc.add_paragraph()
-run = p.add_run('Want to use a free model? ')
-run.bold = True
-p.add_run('Google Gemini\u2019s free tier gives you powerful AI at zero cost. ')
-run = p.add_run('Want total privacy? ')
-run.bold = True
-p.add_run('Ollama runs entirely on your machine \u2014 your questions never leave your computer.')
-
-# ============================================================
-# KEY FEATURES
-# ============================================================
-doc.add_heading('Key Features', level=2)
-
-features = [
-    ('Streaming responses', ' \u2014 watch the AI think in real time with live Markdown rendering'),
-    ('Automatic source retrieval', ' \u2014 the AI calls up to 10 rounds of tools to find exactly the right texts'),
-    ('Mermaid diagrams', ' \u2014 ask for a timeline or flowchart and get a visual diagram'),
-    ('Citation auto-linking', ' \u2014 even bare references like \u201cBerakhot 2a\u201d become clickable Sefaria links'),
-    ('Chat history', ' \u2014 save, load, and manage multiple conversations'),
-    ('Print to PDF', ' \u2014 export any conversation for study or sharing'),
-    ('First-run setup wizard', ' \u2014 choose your provider and start chatting in under a minute'),
-    ('Auto-updates', ' \u2014 always get the latest features automatically'),
-    ('100% private', ' \u2014 no telemetry, no analytics, no tracking. Your API keys and chats stay on your machine.'),
-]
-
-for feat_name, feat_desc in features:
-    p = doc.add_paragraph(style='List Bullet')
-    run = p.add_run(feat_name)
+    run.font.size = _PT14
+    run.font.color.rgb = _GREY55
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle.paragraph_format.space_after = Pt(4)
+
+    # Decorative line
+    p = add_para()
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = p.add_run(_RULE)
+    run.font.color.rgb = _BLUE
+    run.font.size = _PT10
+    p.paragraph_format.space_after = Pt(12)
+
+    # ============================================================
+    # INTRO
+    # ============================================================
+    p = add_para()
+    run = p.add_run('Ever wished you could have a conversation with the entire Sefaria library? ')
+    run.italic = True
+    run.font.size = _PT12
+    run.font.color.rgb = _GREY44
+    run = p.add_run('Now you can.')
     run.bold = True
-    run.font.color.rgb = RGBColor(0x1A, 0x47, 0x8A)
-    p.add_run(feat_desc)
-
-# ============================================================
-# GET STARTED
-# ============================================================
-doc.add_heading('Get Started', level=2)
-
-steps = [
-    'Download Sefaria Chat (available on Windows, including the Microsoft Store)',
-    'Pick a provider (try Gemini for free, or Ollama for fully offline)',
-    'Start asking questions!',
-]
-for i, step in enumerate(steps, 1):
-    p = doc.add_paragraph()
-    run = p.add_run(f'{i}.  ')
+    run.italic = True
+    run.font.size = _PT12
+    run.font.color.rgb = _BLUE
+
+    add_para(
+        'Sefaria Chat is a free, open-source desktop app that connects the world’s largest '
+        'digital collection of Jewish texts — Torah, Talmud, Midrash, Halakha, Kabbalah, '
+        'philosophy, and more — to the AI model of your choice. Ask a question in plain English, '
+        'and the AI automatically searches Sefaria’s library, retrieves primary sources with '
+        'original Hebrew/Aramaic alongside English translations, and weaves them into rich, scholarly '
+        'responses — complete with clickable links back to Sefaria.org.'
+    )
+
+    # ============================================================
+    # WHAT CAN YOU ASK?
+    # ============================================================
+    add_heading('What Can You Ask?', level=2)
+
+    prompts = [
+        ('“What is today’s Torah portion and Daf Yomi?”',
+         ' — pulls the live Jewish calendar'),
+        ('“Show me an ancient manuscript of Genesis 1:1”',
+         ' — retrieves and displays actual manuscript images'),
+        ('“Compare translations of Psalm 23”',
+         ' — shows multiple English renderings side by side'),
+        ('“What does Judaism teach about forgiveness and repentance?”',
+         ' — searches across the entire library and synthesizes sources from Tanakh, Talmud, Rambam, and beyond'),
+        ('“Explain the structure of the Talmud — Mishnah and Gemara”',
+         ' — gives a comprehensive educational overview'),
+        ('“Tell me about Shabbat — its sources, themes, and subtopics”',
+         ' — pulls Sefaria’s curated topic pages'),
+        ('“Look up the word ‘chesed’ in Jastrow’s dictionary”',
+         ' — searches classical Hebrew/Aramaic dictionaries'),
+        ('“What does Rashi say about Noah’s drunkenness?”',
+         ' — pinpoints specific commentary'),
+    ]
+
+    _render_bold_bullets(doc, prompts)
+
+    add_para()
+    p = add_para()
+    run = p.add_run('Every text reference is a clickable hyperlink. ')
+    run.bold = True
+    p.add_run('Click any source and it opens right inside the app in a side-by-side embedded browser.')
+
+    # ============================================================
+    # USE ANY AI MODEL
+    # ============================================================
+    add_heading('Use Any AI Model — Online or Offline', level=2)
+
+    add_para(
+        'Sefaria Chat supports 9 LLM providers with dozens of models, so you pick what works for you:'
+    )
+
+    providers = [
+        ('☁️', 'Google Gemini', 'Gemini 2.5 Flash, Pro, and more — free tier available!'),
+        ('☁️', 'OpenAI', 'GPT-4.1, GPT-4o, o4 Mini'),
+        ('☁️', 'Anthropic', 'Claude Sonnet 4, Claude 3.5 Haiku'),
+        ('☁️', 'xAI', 'Grok 3, Grok 3 Mini (fast & regular)'),
+        ('☁️', 'Mistral AI', 'Mistral Small, Medium, Large'),
+        ('☁️', 'DeepSeek', 'DeepSeek-V3, DeepSeek-R1'),
+        ('☁️', 'Groq', 'Llama 3.3 70B, Mixtral, Gemma 2 — blazing fast inference'),
+        ('☁️', 'OpenRouter', 'Multi-model gateway — access dozens of models through one key'),
+        ('\U0001f4bb', 'Ollama (Local)', 'Runs 100% offline. No API key. No internet. Auto-detects your models.'),
+    ]
+
+    # Provider table, sized up front so it never grows row by row
+    table = doc.add_table(rows=1 + len(providers), cols=3)
+    table.style = 'Light Grid Accent 1'
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+
+    headers = ['', 'Provider', 'Highlights']
+    header_cells = table.rows[0].cells
+    for i, h in enumerate(headers):
+        set_cell(header_cells[i], h, bold=True)
+
+    rows = table.rows
+    for row_idx, (icon, provider, highlights) in enumerate(providers, start=1):
+        c0, c1, c2 = rows[row_idx].cells
+        set_cell(c0, icon)
+        set_cell(c1, provider, bold=True)
+        set_cell(c2, highlights)
+
+    # Set column widths
+    for row in table.rows:
+        row.cells[0].width = Inches(0.4)
+        row.cells[1].width = Inches(1.6)
+        row.cells[2].width = Inches(4.5)
+
+    add_para()
+
+    # Callout paragraphs
+    p = add_para()
+    run = p.add_run('Want to use a free model? ')
+    run.bold = True
+    p.add_run('Google Gemini’s free tier gives you powerful AI at zero cost. ')
+    run = p.add_run('Want total privacy? ')
+    run.bold = True
+    p.add_run('Ollama runs entirely on your machine — your questions never leave your computer.')
+
+    # ============================================================
+    # KEY FEATURES
+    # ============================================================
+    add_heading('Key Features', level=2)
+
+    features = [
+        ('Streaming responses', ' — watch the AI think in real time with live Markdown rendering'),
+        ('Automatic source retrieval', ' — the AI calls up to 10 rounds of tools to find exactly the right texts'),
+        ('Mermaid diagrams', ' — ask for a timeline or flowchart and get a visual diagram'),
+        ('Citation auto-linking', ' — even bare references like “Berakhot 2a” become clickable Sefaria links'),
+        ('Chat history', ' — save, load, and manage multiple conversations'),
+        ('Print to PDF', ' — export any conversation for study or sharing'),
+        ('First-run setup wizard', ' — choose your provider and start chatting in under a minute'),
+        ('Auto-updates', ' — always get the latest features automatically'),
+        ('100% private', ' — no telemetry, no analytics, no tracking. Your API keys and chats stay on your machine.'),
+    ]
+
+    _render_bold_bullets(doc, features)
+
+    # ============================================================
+    # GET STARTED
+    # ============================================================
+    add_heading('Get Started', level=2)
+
+    steps = [
+        'Download Sefaria Chat (available on Windows, including the Microsoft Store)',
+        'Pick a provider (try Gemini for free, or Ollama for fully offline)',
+        'Start asking questions!',
+    ]
+    for i, step in enumerate(steps, 1):
+        p = add_para()
+        run = p.add_run(f'{i}.  ')
+        run.bold = True
+        run.font.color.rgb = _BLUE
+        run.font.size = _PT12
+        run2 = p.add_run(step)
+        run2.font.size = _PT12
+
+    add_para()
+
+    # Closing
+    p = add_para()
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = p.add_run('Built with love for the Jewish text tradition.')
+    run.italic = True
+    run.font.size = _PT11
+    run.font.color.rgb = _GREY55
+
+    p = add_para()
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = p.add_run('MIT licensed • Open source • Free forever')
     run.bold = True
-    run.font.color.rgb = RGBColor(0x1A, 0x47, 0x8A)
-    run.font.size = Pt(12)
-    run2 = p.add_run(step)
-    run2.font.size = Pt(12)
-
-doc.add_paragraph()
-
-# Closing
-p = doc.add_paragraph()
-p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-run = p.add_run('Built with love for the Jewish text tradition.')
-run.italic = True
-run.font.size = Pt(11)
-run.font.color.rgb = RGBColor(0x55, 0x55, 0x55)
-
-p = doc.add_paragraph()
-p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-run = p.add_run('MIT licensed \u2022 Open source \u2022 Free forever')
-run.bold = True
-run.font.size = Pt(11)
-run.font.color.rgb = RGBColor(0x1A, 0x47, 0x8A)
-
-doc.add_paragraph()
-p = doc.add_paragraph()
-p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-run = p.add_run('Sefaria Chat is an independent project and is not developed by or affiliated with Sefaria.org.')
-run.italic = True
-run.font.size = Pt(9)
-run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
-
-# Save
-output_path = os.path.join(os.path.dirname(__file__), 'Sefaria Chat Announcement.docx')
-doc.save(output_path)
-print(f'Saved: {output_path}')
+    run.font.size = _PT11
+    run.font.color.rgb = _BLUE
+
+    add_para()
+    p = add_para()
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = p.add_run('Sefaria Chat is an independent project and is not developed by or affiliated with Sefaria.org.')
+    run.italic = True
+    run.font.size = _PT9
+    run.font.color.rgb = _GREY99
+
+    # Save: serialize to memory first, then write the file in one syscall
+    output_path = os.path.join(os.path.dirname(__file__), 'Sefaria Chat Announcement.docx')
+    buf = io.BytesIO()
+    doc.save(buf)
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, buf.getvalue())
+    finally:
+        os.close(fd)
+    print(f'Saved: {output_path}')
+
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,138 @@
+"""Build the static skeleton for the Technical Reference document.
+
+The styles, title page, and table of contents never change between runs,
+so they are rendered once into docs/_skeleton.docx. generate_doc.py
+loads that skeleton and only adds the content sections on top of it,
+skipping a few hundred paragraph constructions per run. The skeleton is
+rebuilt automatically whenever this script is newer than the cached file.
+"""
+
+from docx import Document
+from docx.shared import Pt, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+import os
+
+SKELETON_PATH = os.path.join('docs', '_skeleton.docx')
+
+# Sizes and colors reused across the styles block and title page
+PT9 = Pt(9)
+PT12 = Pt(12)
+DARK = RGBColor(0x1a, 0x1a, 0x2e)
+GREY55 = RGBColor(0x55, 0x55, 0x55)
+GREY88 = RGBColor(0x88, 0x88, 0x88)
+GREY_AA = RGBColor(0xaa, 0xaa, 0xaa)
+
+# Pre-resolved qualified name for the TOC field
+_QN_INSTR = qn('w:instr')
+
+
+def ensure_skeleton():
+    """Return the skeleton path, rebuilding it if missing or stale."""
+    if (not os.path.exists(SKELETON_PATH)
+            or os.path.getmtime(SKELETON_PATH) < os.path.getmtime(__file__)):
+        build_skeleton()
+    return SKELETON_PATH
+
+
+def build_skeleton():
+    doc = Document()
+
+    # ── Styles ─────────────────────────────────────────────────────────
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = 'Calibri'
+    font.size = Pt(11)
+
+    styles = doc.styles
+    for h in (styles['Heading 1'], styles['Heading 2'], styles['Heading 3']):
+        h.font.color.rgb = DARK
+
+    # Code style
+    if 'Code' not in [s.name for s in styles]:
+        code_style = styles.add_style('Code', WD_STYLE_TYPE.PARAGRAPH)
+        code_style.font.name = 'Consolas'
+        code_style.font.size = PT9
+        # Zero here so add_code_block paragraphs need no per-paragraph override
+        code_style.paragraph_format.space_before = Pt(0)
+        code_style.paragraph_format.space_after = Pt(0)
+
+    # Table text styles, so add_table can format a cell with one assignment
+    tbl_cell = styles.add_style('TableCell', WD_STYLE_TYPE.PARAGRAPH)
+    tbl_cell.font.name = 'Calibri'
+    tbl_cell.font.size = PT9
+    tbl_header = styles.add_style('TableHeader', WD_STYLE_TYPE.PARAGRAPH)
+    tbl_header.font.name = 'Calibri'
+    tbl_header.font.size = PT9
+    tbl_header.font.bold = True
+
+    # ── Title page ─────────────────────────────────────────────────────
+    doc.add_paragraph()
+    doc.add_paragraph()
+    title = doc.add_paragraph()
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = title.add_run('Sefaria Chat')
+    run.font.size = Pt(36)
+    run.font.color.rgb = DARK
+    run.bold = True
+
+    subtitle = doc.add_paragraph()
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = subtitle.add_run('Technical Reference & Architecture Guide')
+    run.font.size = Pt(18)
+    run.font.color.rgb = GREY55
+
+    doc.add_paragraph()
+
+    version = doc.add_paragraph()
+    version.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = version.add_run('Version 1.3.2')
+    run.font.size = Pt(14)
+
+    date = doc.add_paragraph()
+    date.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = date.add_run('February 2026')
+    run.font.size = PT12
+    run.font.color.rgb = GREY88
+
+    doc.add_paragraph()
+    disclaimer = doc.add_paragraph()
+    disclaimer.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = disclaimer.add_run('© 2026 Jason Leznek · MIT License')
+    run.font.size = Pt(10)
+    run.font.color.rgb = GREY88
+
+    note = doc.add_paragraph()
+    note.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = note.add_run('Not developed by or affiliated with Sefaria.org')
+    run.font.size = PT9
+    run.font.italic = True
+    run.font.color.rgb = GREY_AA
+
+    doc.add_page_break()
+
+    # ── Table of contents ──────────────────────────────────────────────
+    # A single TOC field; Word fills it in from the heading styles and
+    # keeps it correct if sections move.
+    doc.add_heading('Table of Contents', level=1)
+    p = doc.add_paragraph()
+    fld = OxmlElement('w:fldSimple')
+    fld.set(_QN_INSTR, 'TOC \\o "1-3" \\h \\z \\u')
+    p._p.append(fld)
+
+    # The field carries no cached result, so tell Word to refresh fields
+    # on open; without this the TOC page renders blank.
+    upd = OxmlElement('w:updateFields')
+    upd.set(qn('w:val'), 'true')
+    doc.settings.element.insert_element_before(upd, 'w:compat')
+
+    doc.add_page_break()
+
+    doc.save(SKELETON_PATH)
+    print(f'Skeleton saved to: {SKELETON_PATH}')
+
+
+if __name__ == '__main__':
+    build_skeleton()
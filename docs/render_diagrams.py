@@ -0,0 +1,31 @@
+"""Render the Mermaid diagram sources to PNG in parallel.
+
+Run from the repo root before generate_doc.py when a .mmd source has
+changed. The three renders are independent, so they run concurrently
+instead of back to back. Requires the Mermaid CLI
+(npm install -g @mermaid-js/mermaid-cli).
+"""
+
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+DIAGRAMS = ['architecture', 'flowchart', 'sequence']
+
+
+def render(name):
+    src = os.path.join('docs', f'{name}.mmd')
+    out = os.path.join('docs', f'{name}.png')
+    subprocess.run(['mmdc', '-i', src, '-o', out, '-s', '2'], check=True)
+    return out
+
+
+def main():
+    # Each job is one mmdc subprocess, so threads are enough to overlap them
+    with ThreadPoolExecutor(max_workers=len(DIAGRAMS)) as ex:
+        for out in ex.map(render, DIAGRAMS):
+            print(f'Rendered: {out}')
+
+
+if __name__ == '__main__':
+    main()